@@ -35,7 +35,15 @@ class LintPatch:
         wrapper: MetadataWrapper,
         original_node: cst.CSTNode,
         replacement_node: Union[cst.CSTNode, cst.RemovalSentinel],
+        *,
+        minimize: bool = False,
     ) -> "LintPatch":
+        """
+        Generates a patch replacing `original_node` with `replacement_node`. Passing
+        `minimize=True` is equivalent to calling `minimize()` on the result, but avoids
+        constructing the intermediate patch.
+        """
+        create = LintPatch._create_minimized if minimize else LintPatch
         # Batch the execution of these position providers
         wrapper.resolve_many(
             [
@@ -73,7 +81,7 @@ class LintPatch:
                 )
                 original_str = partial.get_original_statement_code()
                 patched_str = partial.get_modified_statement_code(patched_statement)
-                return LintPatch(
+                return create(
                     partial.start_offset,
                     positions[possible_statement].start,
                     original_str,
@@ -90,7 +98,7 @@ class LintPatch:
                     cst.Module,
                 )
                 patched_str = patched_module.code
-                return LintPatch(0, CodePosition(1, 0), original_str, patched_str)
+                return create(0, CodePosition(1, 0), original_str, patched_str)
 
     def apply(self, original_module_str: str) -> str:
         return "".join(
@@ -108,19 +116,44 @@ class LintPatch:
         `arc lint` does, you should attempt to minimize your patches to reduce the
         chance of overlapping changes.
         """
-        return self._minimize_tail()._minimize_head()
+        return LintPatch._create_minimized(
+            self.start_offset,
+            self.start_position,
+            self.original_diff_str,
+            self.patched_diff_str,
+        )
 
-    def _minimize_head(self) -> "LintPatch":
+    @staticmethod
+    def _create_minimized(
+        start_offset: int,
+        start_position: CodePosition,
+        original_diff_str: str,
+        patched_diff_str: str,
+    ) -> "LintPatch":
         """
-        Strips any characters off of the head of the patch that are unchanged, reducing
-        the size of the patch.
+        Strips any characters off of the head and tail of the patch that are unchanged,
+        and constructs a single `LintPatch` from what's left.
         """
+        # Strip the tail first. This is easier than the head because we don't have to
+        # track line/column numbers.
+        matching_tail_len = 0
+        for (a, b) in zip(reversed(original_diff_str), reversed(patched_diff_str)):
+            if a != b:
+                break
+            matching_tail_len += 1
+        # We can't use `arr[:-offset]`` because when `offset` is `0`, we'd end up
+        # with an empty string.
+        original_diff_str = original_diff_str[
+            : len(original_diff_str) - matching_tail_len
+        ]
+        patched_diff_str = patched_diff_str[: len(patched_diff_str) - matching_tail_len]
+
         # line is 1-indexed, column is 0-indexed
-        start_line, start_column = self.start_position.line, self.start_position.column
+        start_line, start_column = start_position.line, start_position.column
 
         matching_head_len = 0
         was_cr = False  # track \r\n newlines as a single newline
-        for (a, b) in zip(self.original_diff_str, self.patched_diff_str):
+        for (a, b) in zip(original_diff_str, patched_diff_str):
             if a != b:
                 break
             elif a == "\n":
@@ -138,34 +171,10 @@ class LintPatch:
             matching_head_len += 1
 
         return LintPatch(
-            self.start_offset + matching_head_len,
+            start_offset + matching_head_len,
             CodePosition(start_line, start_column),
-            self.original_diff_str[matching_head_len:],
-            self.patched_diff_str[matching_head_len:],
-        )
-
-    def _minimize_tail(self) -> "LintPatch":
-        """
-        Strips any characters off of the tail of the patch that are unchanged, reducing
-        the size of the patch.
-        """
-        # this is easier than _minimize_head because we don't have to track line/column
-        # numbers.
-        matching_tail_len = 0
-        for (a, b) in zip(
-            reversed(self.original_diff_str), reversed(self.patched_diff_str)
-        ):
-            if a != b:
-                break
-            matching_tail_len += 1
-
-        return LintPatch(
-            self.start_offset,
-            self.start_position,
-            # We can't use `arr[:-offset]`` because when `offset` is `0`, we'd end up
-            # with an empty string.
-            self.original_diff_str[: len(self.original_diff_str) - matching_tail_len],
-            self.patched_diff_str[: len(self.patched_diff_str) - matching_tail_len],
+            original_diff_str[matching_head_len:],
+            patched_diff_str[matching_head_len:],
         )
 
 
@@ -155,7 +155,7 @@ class Flake8CompatApplication(Flake8BaseApplication):
 
 
 class Flake8LintRuleReport(BaseLintRuleReport):
-    pass
+    __slots__ = ()
 
 
 @lru_cache(maxsize=1)
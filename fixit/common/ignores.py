@@ -7,6 +7,7 @@
 All of the ignore logic for the lint engine.
 """
 
+import sys
 import tokenize
 from collections import defaultdict
 from dataclasses import dataclass
@@ -14,6 +15,8 @@ from enum import Enum
 from typing import (
     Collection,
     Dict,
+    FrozenSet,
+    Iterable,
     Iterator,
     List,
     Mapping,
@@ -54,10 +57,17 @@ class SuppressionCommentKind(Enum):
 
 
 class SuppressionComment:
+    # The rules in the order they're written in the comment, so that the comment can be
+    # rewritten. Treat this as read-only after construction: reports are matched
+    # against `_ignored_rules_set`, which is derived from it once.
     ignored_rules: IgnoredRules
+    # `None` means that all rules are ignored.
+    _ignored_rules_set: Optional[FrozenSet[str]]
     # a lint-fixme or lint-ignore comment can span multiple lines, so it may be composed
     # of multiple tokens.
     tokens: Sequence[tokenize.TokenInfo]
+    # The physical line of the first token, i.e. where the comment starts.
+    start_line: int
     used_by: List[BaseLintRuleReport]
     kind: str
     reason: Optional[str]
@@ -70,14 +80,20 @@ class SuppressionComment:
         reason: Optional[str] = None,
     ) -> None:
         self.ignored_rules = ignored_rules
+        self._ignored_rules_set = (
+            None
+            if isinstance(ignored_rules, AllRulesType)
+            else frozenset(ignored_rules)
+        )
         self.tokens = tokens
+        self.start_line = tokens[0].start[0]
         self.used_by = []
         self.kind = kind
         self.reason = reason
 
     def should_ignore_report(self, report: BaseLintRuleReport) -> bool:
-        ignored_rules = self.ignored_rules
-        return isinstance(ignored_rules, AllRulesType) or report.code in ignored_rules
+        ignored_rules_set = self._ignored_rules_set
+        return ignored_rules_set is None or report.code in ignored_rules_set
 
     def mark_used_by(self, report: BaseLintRuleReport) -> None:
         self.used_by.append(report)
@@ -93,7 +109,9 @@ def _parse_comma_separated_rules(rules_str: Optional[str]) -> IgnoredRules:
     if rules_str is None:
         return AllRulesType.ALL_RULES
     item_gen = (c.strip() for c in rules_str.split(","))
-    rules_list = [item for item in item_gen if item]
+    # Rule codes are compared against every report, and there are only a few distinct
+    # ones, so intern them.
+    rules_list = [sys.intern(item) for item in item_gen if item]
     return rules_list if rules_list else AllRulesType.ALL_RULES
 
 
@@ -260,6 +278,25 @@ class IgnoreInfo:
             report
         ) or self.local_ignore_info.should_ignore_report(report)
 
+    def filter_reports(
+        self, reports: Iterable[BaseLintRuleReport]
+    ) -> List[BaseLintRuleReport]:
+        """
+        Returns the reports that aren't suppressed, in their original order. This is
+        equivalent to filtering with `should_ignore_report` (including marking which
+        suppression comments were used), but skips the per-report work entirely when
+        the file has nothing that could suppress them.
+        """
+        global_ignore_info = self.global_ignore_info
+        if not self.local_ignore_info.local_suppression_comments:
+            # Most files don't have any suppression comments at all.
+            if not global_ignore_info.globally_ignored_rules:
+                return list(reports)
+            return [
+                r for r in reports if not global_ignore_info.should_ignore_report(r)
+            ]
+        return [r for r in reports if not self.should_ignore_report(r)]
+
     @staticmethod
     def compute(
         *, comment_info: CommentInfo, line_mapping_info: LineMappingInfo
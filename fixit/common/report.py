@@ -5,21 +5,25 @@
 
 import abc
 import ast
+import sys
 from pathlib import Path
 from pickle import PicklingError
-from typing import Collection, Optional, Sequence, Union
+from typing import Collection, Optional, Sequence, Tuple, Union
 
 import libcst as cst
 
 from fixit.common.autofix import LintPatch
 
 
-class BaseLintRuleReport(abc.ABC):
+class BaseLintRuleReport:
     """
     Represents a lint violation. This is generated by calling `self.context.report`
     in your lint rule, and is saved to the context's `reports` list.
     """
 
+    # A large lint run can accumulate a lot of reports, so avoid a `__dict__` on each.
+    __slots__ = ("file_path", "code", "message", "line", "column")
+
     file_path: Path
     code: str
     message: str
@@ -33,7 +37,9 @@ class BaseLintRuleReport(abc.ABC):
         self, *, file_path: Path, code: str, message: str, line: int, column: int
     ) -> None:
         self.file_path = file_path
-        self.code = code
+        # Codes are repeatedly compared against the (also interned) codes in suppression
+        # comments, and there are only a few distinct ones.
+        self.code = sys.intern(code)
         self.message = message
         self.line = line
         self.column = column
@@ -50,11 +56,39 @@ class BaseLintRuleReport(abc.ABC):
             "Lint rule reports are potentially very complex objects. They can contain "
             + "a syntax tree or an entire module's source code. They should not be "
             + "pickled (or returned by a multiprocessing worker). Instead, extract "
-            + "the fields you care about, and pickle those."
+            + "the fields you care about, and pickle those, e.g. with "
+            + "`to_serializable()`."
+        )
+
+    def to_serializable(self) -> Tuple[str, str, str, int, int]:
+        """
+        Returns the plain fields of this report as a tuple which can be cheaply pickled
+        and sent across process boundaries. Use `from_serializable` to turn it back into
+        a report.
+        """
+        return (str(self.file_path), self.code, self.message, self.line, self.column)
+
+    @staticmethod
+    def from_serializable(
+        serialized: Tuple[str, str, str, int, int]
+    ) -> "BaseLintRuleReport":
+        """
+        Reconstructs a report from the output of `to_serializable`. Any syntax tree or
+        autofix information carried by the original report is not preserved.
+        """
+        file_path, code, message, line, column = serialized
+        return BaseLintRuleReport(
+            file_path=Path(file_path),
+            code=code,
+            message=message,
+            line=line,
+            column=column,
         )
 
 
 class AstLintRuleReport(BaseLintRuleReport):
+    __slots__ = ("node",)
+
     def __init__(
         self,
         *,
@@ -72,6 +106,8 @@ class AstLintRuleReport(BaseLintRuleReport):
 
 
 class CstLintRuleReport(BaseLintRuleReport):
+    __slots__ = ("node", "module", "module_bytes", "replacement_node", "_cached_patch")
+
     def __init__(
         self,
         *,
@@ -94,7 +130,8 @@ class CstLintRuleReport(BaseLintRuleReport):
         self.replacement_node = replacement_node
         self._cached_patch: Optional[LintPatch] = None
 
-    # Ideally this would use functools.cached_property, but that's only in py3.8+.
+    # functools.cached_property needs an instance `__dict__`, which `__slots__` rules
+    # out, so we cache in a slot instead.
     @property
     def patch(self) -> Optional[LintPatch]:
         """
@@ -109,7 +146,8 @@ class CstLintRuleReport(BaseLintRuleReport):
                 wrapper=self.module,
                 original_node=self.node,
                 replacement_node=replacement_node,
-            ).minimize()
+                minimize=True,
+            )
             self._cached_patch = cached
         return cached
 
@@ -82,6 +82,10 @@ class AutofixTest(UnitTest):
         patch = LintPatch.get(wrapper, n, get_replacement_node(n))
         self.assertEqual(patch.apply(original_module), replacement_module)
         self.assertEqual(patch.minimize().apply(original_module), replacement_module)
+        self.assertEqual(
+            LintPatch.get(wrapper, n, get_replacement_node(n), minimize=True),
+            patch.minimize(),
+        )
 
     @data_provider(
         {
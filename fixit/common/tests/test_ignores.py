@@ -6,197 +6,213 @@
 import tokenize
 from io import BytesIO
 from pathlib import Path
-from typing import Container, Iterable, Tuple
+from typing import Any, Iterable, Mapping, Tuple
 
-import libcst as cst
 from libcst.testing.utils import UnitTest, data_provider
 
 from fixit.common.comments import CommentInfo
-from fixit.common.ignores import IgnoreInfo
+from fixit.common.ignores import AllRulesType, IgnoreInfo
 from fixit.common.line_mapping import LineMappingInfo
-from fixit.common.report import CstLintRuleReport
+from fixit.common.report import BaseLintRuleReport
 from fixit.common.utils import dedent_with_lstrip
 
 
-class IgnoreInfoTest(UnitTest):
-    @data_provider(
-        {
-            # A noqa comment can be used without a specified code, which will ignore all
-            # lint errors on that line. This is a bad practice, but we have to support
-            # it for compatibility with existing code. (until we can codemod it away)
-            "noqa_all_legacy": {
-                "source": dedent_with_lstrip(
-                    """
-                    fn1()
-                    fn2()  # noqa
-                    fn3()
-                    """
-                ),
-                "ignored_code": "IgnoredRule",
-                "ignored_lines": [2],
-            },
-            # When a noqa comment is specified with codes, it should only ignore the
-            # specified codes.
-            "noqa_with_code": {
-                "source": dedent_with_lstrip(
-                    """
-                    fn1()  # noqa: IgnoredRule
-                    fn2()  # noqa: IgnoredRule: Message
-                    fn3()  # noqa: IgnoredRule, Ignored2Rule: Message
-                    fn4()  # noqa: Ignored1Rule
-                    fn5()  # noqa: Ignored1Rule, Ignored2Rule
-                    fn6()  # noqa: Ignored1Rule, Ignored2Rule: Message
-                    """
-                ),
-                "ignored_code": "Ignored1Rule",
-                "ignored_lines": [4, 5, 6],
-            },
-            "noqa_multiline": {
-                "source": dedent_with_lstrip(
-                    """
-                    fn1(line, \\
-                    continuation)  # noqa: IgnoredRule
+_IGNORED_LINES_CASES: Mapping[str, Mapping[str, Any]] = {
+    # A noqa comment can be used without a specified code, which will ignore all
+    # lint errors on that line. This is a bad practice, but we have to support
+    # it for compatibility with existing code. (until we can codemod it away)
+    "noqa_all_legacy": {
+        "source": dedent_with_lstrip(
+            """
+            fn1()
+            fn2()  # noqa
+            fn3()
+            """
+        ),
+        "ignored_code": "IgnoredRule",
+        "ignored_lines": [2],
+    },
+    # When a noqa comment is specified with codes, it should only ignore the
+    # specified codes.
+    "noqa_with_code": {
+        "source": dedent_with_lstrip(
+            """
+            fn1()  # noqa: IgnoredRule
+            fn2()  # noqa: IgnoredRule: Message
+            fn3()  # noqa: IgnoredRule, Ignored2Rule: Message
+            fn4()  # noqa: Ignored1Rule
+            fn5()  # noqa: Ignored1Rule, Ignored2Rule
+            fn6()  # noqa: Ignored1Rule, Ignored2Rule: Message
+            """
+        ),
+        "ignored_code": "Ignored1Rule",
+        "ignored_lines": [4, 5, 6],
+    },
+    "noqa_multiline": {
+        "source": dedent_with_lstrip(
+            """
+            fn1(line, \\
+            continuation)  # noqa: IgnoredRule
 
-                    fn2()
+            fn2()
 
-                    fn3('''
-                        multiline
-                        string
-                    ''')  # noqa: IgnoredRule
-                    """
-                ),
-                "ignored_code": "IgnoredRule",
-                "ignored_lines": [1, 2, 6, 7, 8, 9],
-            },
-            "noqa_file": {
-                "source": dedent_with_lstrip(
-                    """
-                    # noqa-file: IgnoredRule: Some reason
-                    fn1()
-                    """
-                ),
-                "ignored_code": "IgnoredRule",
-                "ignored_lines": [1, 2, 3],
-            },
-            "noqa_file_multiple_codes": {
-                "source": dedent_with_lstrip(
-                    """
-                    # noqa-file: IgnoredRule, Ignored1Rule, Ignored2Rule: Some reason
-                    fn1()
-                    """
-                ),
-                "ignored_code": "Ignored1Rule",
-                "ignored_lines": [1, 2, 3],
-            },
-            "noqa_file_requires_code_and_reason": {
-                "source": dedent_with_lstrip(
-                    """
-                    # noqa-file
-                    # noqa-file: IgnoredRule
-                    # Neither of these noqa-files should work because they're incomplete
-                    fn1()
-                    """
-                ),
-                "ignored_code": "IgnoredRule",
-                "ignored_lines": [],
-            },
-            "backwards_compatibility_classname": {
-                "source": dedent_with_lstrip(
-                    """
-                    fn1() # noqa: IG00, IgnoredRule
-                    """
-                ),
-                "ignored_code": "IgnoredRule",
-                "ignored_lines": [1],
-            },
-            "backwards_compatibility_oldcode": {
-                "source": dedent_with_lstrip(
-                    """
-                    fn1() # noqa: IG00, IgnoredRule
-                    """
-                ),
-                "ignored_code": "IG00",
-                "ignored_lines": [1],
-            },
-            "lint_fixme": {
-                "source": dedent_with_lstrip(
-                    """
-                    fn1()
+            fn3('''
+                multiline
+                string
+            ''')  # noqa: IgnoredRule
+            """
+        ),
+        "ignored_code": "IgnoredRule",
+        "ignored_lines": [1, 2, 6, 7, 8, 9],
+    },
+    "noqa_file": {
+        "source": dedent_with_lstrip(
+            """
+            # noqa-file: IgnoredRule: Some reason
+            fn1()
+            """
+        ),
+        "ignored_code": "IgnoredRule",
+        "ignored_lines": [1, 2, 3],
+    },
+    "noqa_file_multiple_codes": {
+        "source": dedent_with_lstrip(
+            """
+            # noqa-file: IgnoredRule, Ignored1Rule, Ignored2Rule: Some reason
+            fn1()
+            """
+        ),
+        "ignored_code": "Ignored1Rule",
+        "ignored_lines": [1, 2, 3],
+    },
+    "noqa_file_requires_code_and_reason": {
+        "source": dedent_with_lstrip(
+            """
+            # noqa-file
+            # noqa-file: IgnoredRule
+            # Neither of these noqa-files should work because they're incomplete
+            fn1()
+            """
+        ),
+        "ignored_code": "IgnoredRule",
+        "ignored_lines": [],
+    },
+    "backwards_compatibility_classname": {
+        "source": dedent_with_lstrip(
+            """
+            fn1() # noqa: IG00, IgnoredRule
+            """
+        ),
+        "ignored_code": "IgnoredRule",
+        "ignored_lines": [1],
+    },
+    "backwards_compatibility_oldcode": {
+        "source": dedent_with_lstrip(
+            """
+            fn1() # noqa: IG00, IgnoredRule
+            """
+        ),
+        "ignored_code": "IG00",
+        "ignored_lines": [1],
+    },
+    "lint_fixme": {
+        "source": dedent_with_lstrip(
+            """
+            fn1()
 
-                    # lint-fixme: IgnoredRule: Some short reason
-                    fn2(  # this line should be ignored
-                        "multiple",  # but these lines shouldn't
-                        "arguments",
-                    )
+            # lint-fixme: IgnoredRule: Some short reason
+            fn2(  # this line should be ignored
+                "multiple",  # but these lines shouldn't
+                "arguments",
+            )
 
-                    # lint-fixme: IgnoredRule: Some reason spanning
-                    # lint: multiple lines because it's long.
-                    fn3('''
-                        multiline
-                        string
-                    ''')  # this function call is a single logical line
+            # lint-fixme: IgnoredRule: Some reason spanning
+            # lint: multiple lines because it's long.
+            fn3('''
+                multiline
+                string
+            ''')  # this function call is a single logical line
 
-                    fn4()
-                    """
-                ),
-                "ignored_code": "IgnoredRule",
-                "ignored_lines": [3, 4, 9, 10, 11, 12, 13, 14],
-            },
-            "lint_ignore": {
-                "source": dedent_with_lstrip(
-                    """
-                    fn1()
+            fn4()
+            """
+        ),
+        "ignored_code": "IgnoredRule",
+        "ignored_lines": [3, 4, 9, 10, 11, 12, 13, 14],
+    },
+    "lint_ignore": {
+        "source": dedent_with_lstrip(
+            """
+            fn1()
 
-                    # lint-ignore: IgnoredRule: Some reason
-                    fn2()
+            # lint-ignore: IgnoredRule: Some reason
+            fn2()
 
-                    fn3()
-                    """
-                ),
-                "ignored_code": "IgnoredRule",
-                "ignored_lines": [3, 4],
-            },
-            # A lint-ignore can exist right before an EOF. That's fine. We should ignore
-            # all the way to the EOF.
-            "lint_ignore_eof": {
-                "source": dedent_with_lstrip(
-                    """
-                    # lint-ignore: IgnoredRule
-                    """
-                ),
-                "ignored_code": "IgnoredRule",
-                "ignored_lines": [1, 2],
-            },
-        }
-    )
+            fn3()
+            """
+        ),
+        "ignored_code": "IgnoredRule",
+        "ignored_lines": [3, 4],
+    },
+    # A lint-ignore can exist right before an EOF. That's fine. We should ignore
+    # all the way to the EOF.
+    "lint_ignore_eof": {
+        "source": dedent_with_lstrip(
+            """
+            # lint-ignore: IgnoredRule
+            """
+        ),
+        "ignored_code": "IgnoredRule",
+        "ignored_lines": [1, 2],
+    },
+}
+
+
+def _ignored_lines_cases_by_line() -> Mapping[str, Mapping[str, Any]]:
+    """
+    Expands `_IGNORED_LINES_CASES` into one case per physical line (including the line
+    of the `ENDMARKER` token), so that each line is collected as a separate test.
+    """
+    cases = {}
+    for name, case in _IGNORED_LINES_CASES.items():
+        source = case["source"]
+        tokens = tuple(tokenize.tokenize(BytesIO(source.encode("utf-8")).readline))
+        lines = range(1, tokens[-1].end[0] + 1)
+        # Otherwise a typo in `ignored_lines` would silently drop coverage.
+        assert set(case["ignored_lines"]) <= set(
+            lines
+        ), f"{name}: ignored_lines must be within {lines}"
+        for line in lines:
+            cases[f"{name}_line_{line}"] = {
+                "source": source,
+                "ignored_code": case["ignored_code"],
+                "line": line,
+                "ignored": line in case["ignored_lines"],
+            }
+    return cases
+
+
+class IgnoreInfoTest(UnitTest):
+    @data_provider(_ignored_lines_cases_by_line())
     def test_ignored_lines(
-        self, *, source: str, ignored_code: str, ignored_lines: Container[int]
+        self, *, source: str, ignored_code: str, line: int, ignored: bool
     ) -> None:
         tokens = tuple(tokenize.tokenize(BytesIO(source.encode("utf-8")).readline))
         ignore_info = IgnoreInfo.compute(
             comment_info=CommentInfo.compute(tokens=tokens),
             line_mapping_info=LineMappingInfo.compute(tokens=tokens),
         )
-        lines = range(1, tokens[-1].end[0] + 1)
-        actual_ignored_lines = []
-        for line in lines:
-            ignored = ignore_info.should_ignore_report(
-                CstLintRuleReport(
+        self.assertEqual(
+            ignore_info.should_ignore_report(
+                BaseLintRuleReport(
                     file_path=Path("fake/path.py"),
-                    node=cst.EmptyLine(),
                     code=ignored_code,
                     message="message",
                     line=line,
                     column=0,
-                    module=cst.MetadataWrapper(cst.parse_module(source)),
-                    module_bytes=source.encode("utf-8"),
                 )
-            )
-            if ignored:
-                actual_ignored_lines.append(line)
-        # pyre-fixme[6]: Expected `Iterable[Variable[_T]]` for 1st param but got
-        #  `Container[int]`.
-        self.assertEqual(actual_ignored_lines, list(ignored_lines))
+            ),
+            ignored,
+        )
 
     @data_provider(
         {
@@ -316,22 +332,19 @@ class IgnoreInfoTest(UnitTest):
 
         for line, code in reports_on_lines:
             ignore_info.should_ignore_report(
-                CstLintRuleReport(
+                BaseLintRuleReport(
                     file_path=Path("fake/path.py"),
-                    node=cst.EmptyLine(),
                     code=code,
                     message="message",
                     line=line,
                     column=0,
-                    module=cst.MetadataWrapper(cst.parse_module(source)),
-                    module_bytes=source.encode("utf-8"),
                 )
             )
 
         self.assertEqual(
             sorted(
                 [
-                    min(tok.start[0] for tok in c.tokens)
+                    c.start_line
                     for c in ignore_info.suppression_comments
                     if not c.used_by
                 ]
@@ -339,6 +352,93 @@ class IgnoreInfoTest(UnitTest):
             sorted(unused_comments),
         )
 
+    @data_provider(
+        {
+            "no_suppressions": {
+                "source": "fn1()\nfn2()\n",
+                "kept_lines": [1, 2],
+                "used_by_lines": {},
+            },
+            "noqa_file": {
+                "source": "# noqa-file: IgnoredRule: Some reason\nfn1()\n",
+                "kept_lines": [],
+                "used_by_lines": {},
+            },
+            "local_suppressions": {
+                "source": dedent_with_lstrip(
+                    """
+                    # lint-ignore: IgnoredRule: Some reason
+                    fn1()
+                    fn2()  # noqa: OtherRule
+                    fn3()
+                    """
+                ),
+                "kept_lines": [3, 4],
+                # Maps each suppression comment's start line to the lines of the
+                # reports that it should be marked as used by.
+                "used_by_lines": {1: [1, 2], 3: []},
+            },
+        }
+    )
+    def test_filter_reports(
+        self,
+        *,
+        source: str,
+        kept_lines: Iterable[int],
+        used_by_lines: Mapping[int, Iterable[int]],
+    ) -> None:
+        tokens = tuple(tokenize.tokenize(BytesIO(source.encode("utf-8")).readline))
+        ignore_info = IgnoreInfo.compute(
+            comment_info=CommentInfo.compute(tokens=tokens),
+            line_mapping_info=LineMappingInfo.compute(tokens=tokens),
+        )
+        reports = [
+            BaseLintRuleReport(
+                file_path=Path("fake/path.py"),
+                code="IgnoredRule",
+                message="message",
+                line=line,
+                column=0,
+            )
+            for line in range(1, source.count("\n") + 1)
+        ]
+        reports_by_line = {r.line: r for r in reports}
+        self.assertEqual(
+            ignore_info.filter_reports(reports),
+            [reports_by_line[line] for line in kept_lines],
+        )
+        self.assertEqual(
+            {c.start_line: c.used_by for c in ignore_info.suppression_comments},
+            {
+                start_line: [reports_by_line[line] for line in lines]
+                for start_line, lines in used_by_lines.items()
+            },
+        )
+
+    def test_filter_reports_all_rules_globally_ignored(self) -> None:
+        source = "# flake8: noqa\nfn1()\n"
+        tokens = tuple(tokenize.tokenize(BytesIO(source.encode("utf-8")).readline))
+        ignore_info = IgnoreInfo.compute(
+            comment_info=CommentInfo.compute(tokens=tokens),
+            line_mapping_info=LineMappingInfo.compute(tokens=tokens),
+        )
+        self.assertIs(
+            ignore_info.global_ignore_info.globally_ignored_rules,
+            AllRulesType.ALL_RULES,
+        )
+        self.assertEqual(len(ignore_info.suppression_comments), 0)
+        reports = [
+            BaseLintRuleReport(
+                file_path=Path("fake/path.py"),
+                code=code,
+                message="message",
+                line=line,
+                column=0,
+            )
+            for line, code in [(1, "IgnoredRule"), (2, "OtherRule")]
+        ]
+        self.assertEqual(ignore_info.filter_reports(reports), [])
+
     def test_multiline_suppression(self) -> None:
         source = """
         # lint-ignore: SomeCode: some reason
@@ -5,6 +5,7 @@
 
 import ast
 import pickle
+import sys
 from pathlib import Path
 
 import libcst as cst
@@ -43,3 +44,55 @@ class LintRuleReportTest(UnitTest):
     def test_is_not_pickleable(self, report: BaseLintRuleReport) -> None:
         with self.assertRaises(pickle.PicklingError):
             pickle.dumps(report)
+
+    @data_provider(
+        {
+            "AstLintRuleReport": [
+                AstLintRuleReport(
+                    file_path=Path("fake/path.py"),
+                    node=ast.parse(""),
+                    code="SomeFakeRule",
+                    message="some message",
+                    line=1,
+                    column=1,
+                )
+            ],
+            "CstLintRuleReport": [
+                CstLintRuleReport(
+                    file_path=Path("fake/path.py"),
+                    node=cst.parse_statement("pass\n"),
+                    code="SomeFakeRule",
+                    message="some message",
+                    line=1,
+                    column=1,
+                    module=cst.MetadataWrapper(cst.parse_module(b"pass\n")),
+                    module_bytes=b"pass\n",
+                )
+            ],
+        }
+    )
+    def test_serializable_round_trip(self, report: BaseLintRuleReport) -> None:
+        serialized = pickle.loads(pickle.dumps(report.to_serializable()))
+        self.assertEqual(
+            serialized,
+            (str(Path("fake/path.py")), "SomeFakeRule", "some message", 1, 1),
+        )
+        restored = BaseLintRuleReport.from_serializable(serialized)
+        self.assertEqual(restored.file_path, report.file_path)
+        self.assertEqual(repr(restored), repr(report))
+
+    def test_code_is_interned(self) -> None:
+        code = "".join(["SomeFake", "Rule"])
+        report = BaseLintRuleReport(
+            file_path=Path("fake/path.py"),
+            code=code,
+            message="some message",
+            line=1,
+            column=1,
+        )
+        self.assertIs(report.code, sys.intern("SomeFakeRule"))
+
+    def test_requires_keyword_arguments(self) -> None:
+        with self.assertRaises(TypeError):
+            # pyre-ignore[19]: Intentionally passing positional arguments.
+            BaseLintRuleReport(Path("fake/path.py"), "SomeFakeRule", "msg", 1, 1)
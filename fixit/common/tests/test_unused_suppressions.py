@@ -313,6 +313,7 @@ class RemoveUnusedSuppressionsRuleTest(UnitTest):
         expected_unused_suppressions_report_messages: Collection[str],
         expected_replacements: Optional[List[str]] = None,
     ) -> None:
+        cst_wrapper = MetadataWrapper(cst.parse_module(source), unsafe_skip_copy=True)
         reports = [
             CstLintRuleReport(
                 file_path=FILE_PATH,
@@ -321,7 +322,7 @@ class RemoveUnusedSuppressionsRuleTest(UnitTest):
                 message="message",
                 line=suppressed_line,
                 column=0,
-                module=cst.MetadataWrapper(cst.parse_module(source)),
+                module=cst_wrapper,
                 module_bytes=source,
             )
             for rule in rules_in_lint_run
@@ -332,7 +333,6 @@ class RemoveUnusedSuppressionsRuleTest(UnitTest):
             comment_info=CommentInfo.compute(tokens=tokens),
             line_mapping_info=LineMappingInfo.compute(tokens=tokens),
         )
-        cst_wrapper = MetadataWrapper(cst.parse_module(source), unsafe_skip_copy=True)
         config = LintConfig(
             rule_config={
                 RemoveUnusedSuppressionsRule.__name__: {
@@ -121,9 +121,9 @@ def lint_file(
 
     if ignore_info is not None:
         # filter the accumulated errors that should be suppressed and report unused suppressions
-        reports = [r for r in reports if not ignore_info.should_ignore_report(r)]
+        reports = ignore_info.filter_reports(reports)
         if find_unused_suppressions and cst_rules:
-            # We had to make sure to call ignore_info.should_ignore_report before running our
+            # We had to make sure to call ignore_info.filter_reports before running our
             # RemoveUnusedSuppressionsRule because ignore_info needs to be up to date for it to work.
             # We can construct a new context since we want a fresh set of reports to append to reports.
             config.rule_config[RemoveUnusedSuppressionsRule.__name__] = {